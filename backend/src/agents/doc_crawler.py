@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+from concurrent.futures import Executor
 from datetime import datetime, timedelta
 from typing import Optional
 
+import ahocorasick
+
+from src.agents.text import ascii_lower
 from src.models.compliance import (
     ComplianceFinding,
     ComplianceFramework,
@@ -54,6 +60,12 @@ OUTDATED_PATTERNS = {
     },
 }
 
+# Single-pass matcher over every outdated pattern, keyed by the lowercased phrase
+_AC = ahocorasick.Automaton()
+for _pattern_name, _config in OUTDATED_PATTERNS.items():
+    _AC.add_word(_config["pattern"].lower(), (_pattern_name, _config))
+_AC.make_automaton()
+
 # Staleness thresholds — docs not updated in this long are flagged
 STALENESS_THRESHOLDS = {
     "privacy_policy": timedelta(days=365),
@@ -62,6 +74,12 @@ STALENESS_THRESHOLDS = {
     "incident_response_plan": timedelta(days=365),
 }
 
+# (doc_type, "doc type", "doc-type", threshold, 2 * threshold) per staleness rule
+_STALENESS_RULES = tuple(
+    (doc_type, doc_type.replace("_", " "), doc_type.replace("_", "-"), threshold, threshold * 2)
+    for doc_type, threshold in STALENESS_THRESHOLDS.items()
+)
+
 
 class DocCrawlerAgent:
     """Crawls documents to detect outdated compliance language and stale policies."""
@@ -76,40 +94,90 @@ class DocCrawlerAgent:
         content: str,
         doc_url: Optional[str] = None,
         last_modified: Optional[datetime] = None,
+        now: Optional[datetime] = None,
     ) -> list[ComplianceFinding]:
-        """Analyze a single document for compliance issues."""
-        findings: list[ComplianceFinding] = []
+        """Analyze a single document for compliance issues.
+
+        ``now`` is the reference time for staleness checks; callers analyzing a batch of
+        documents can read the clock once and pass it to every call.
+        """
+        return self._analyze_document(doc_id, title, content, doc_url, last_modified, now)
 
-        # Check for outdated language patterns
-        content_lower = content.lower()
-        for pattern_name, config in OUTDATED_PATTERNS.items():
-            if config["pattern"].lower() in content_lower:
-                finding = ComplianceFinding(
-                    id=f"doc-{doc_id}-{pattern_name}",
-                    source=SignalSource.DOCUMENT,
-                    source_url=doc_url,
-                    title=f"Outdated compliance language: '{config['pattern']}'",
-                    description=(
-                        f"Document '{title}' contains outdated language: '{config['pattern']}'. "
-                        f"{config['reason']} "
-                        f"Suggested replacement: '{config['replacement']}'."
-                    ),
-                    severity=config["severity"],
-                    frameworks=config["frameworks"],
-                    confidence=0.85,
-                    raw_content=self._extract_context(content, config["pattern"]),
-                    metadata={
-                        "doc_id": doc_id,
-                        "doc_title": title,
-                        "pattern": pattern_name,
-                        "suggested_replacement": config["replacement"],
-                    },
+    async def analyze_documents(
+        self,
+        docs: list[dict],
+        concurrency: int = 16,
+        executor: Optional[Executor] = None,
+    ) -> list[ComplianceFinding]:
+        """Analyze a batch of documents, at most ``concurrency`` at a time.
+
+        Each dict in ``docs`` holds the keyword arguments of ``analyze_document``. Pass an
+        ``executor`` (e.g. a ``ProcessPoolExecutor``) to run the scans off the event loop
+        so several documents are scanned on different cores.
+        """
+        now = datetime.utcnow()
+        sem = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def _one(doc: dict) -> list[ComplianceFinding]:
+            async with sem:
+                kwargs = {"now": now, **doc}
+                if executor is None:
+                    return await self.analyze_document(**kwargs)
+                return await loop.run_in_executor(
+                    executor, functools.partial(self._analyze_document, **kwargs)
                 )
-                findings.append(finding)
+
+        all_findings: list[ComplianceFinding] = []
+        for findings in await asyncio.gather(*(_one(doc) for doc in docs)):
+            all_findings.extend(findings)
+        return all_findings
+
+    def _analyze_document(
+        self,
+        doc_id: str,
+        title: str,
+        content: str,
+        doc_url: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+        now: Optional[datetime] = None,
+    ) -> list[ComplianceFinding]:
+        """Synchronous body of ``analyze_document``, also run in executors for batches."""
+        findings: list[ComplianceFinding] = []
+
+        # Check for outdated language patterns in a single pass over the document
+        seen: set[str] = set()
+        for end_idx, (pattern_name, config) in _AC.iter(ascii_lower(content)):
+            if pattern_name in seen:
+                continue  # One finding per pattern per document
+            seen.add(pattern_name)
+            match_idx = end_idx - len(config["pattern"]) + 1
+            finding = ComplianceFinding(
+                id=f"doc-{doc_id}-{pattern_name}",
+                source=SignalSource.DOCUMENT,
+                source_url=doc_url,
+                title=f"Outdated compliance language: '{config['pattern']}'",
+                description=(
+                    f"Document '{title}' contains outdated language: '{config['pattern']}'. "
+                    f"{config['reason']} "
+                    f"Suggested replacement: '{config['replacement']}'."
+                ),
+                severity=config["severity"],
+                frameworks=config["frameworks"],
+                confidence=0.85,
+                raw_content=self._extract_context(content, config["pattern"], match_idx),
+                metadata={
+                    "doc_id": doc_id,
+                    "doc_title": title,
+                    "pattern": pattern_name,
+                    "suggested_replacement": config["replacement"],
+                },
+            )
+            findings.append(finding)
 
         # Check staleness
         if last_modified:
-            staleness_findings = self._check_staleness(doc_id, title, doc_url, last_modified)
+            staleness_findings = self._check_staleness(doc_id, title, doc_url, last_modified, now)
             findings.extend(staleness_findings)
 
         logger.info(f"Document '{title}': {len(findings)} compliance findings")
@@ -121,16 +189,19 @@ class DocCrawlerAgent:
         title: str,
         doc_url: Optional[str],
         last_modified: datetime,
+        now: Optional[datetime] = None,
     ) -> list[ComplianceFinding]:
         """Check if a document is stale based on its type."""
         findings: list[ComplianceFinding] = []
         title_lower = title.lower()
-        now = datetime.utcnow()
-
-        for doc_type, threshold in STALENESS_THRESHOLDS.items():
-            doc_type_readable = doc_type.replace("_", " ")
-            if doc_type_readable in title_lower or doc_type.replace("_", "-") in title_lower:
-                age = now - last_modified
+        if now is None:
+            now = datetime.utcnow()
+        age = now - last_modified
+
+        for doc_type, doc_type_readable, doc_type_hyphenated, threshold, threshold_x2 in (
+            _STALENESS_RULES
+        ):
+            if doc_type_readable in title_lower or doc_type_hyphenated in title_lower:
                 if age > threshold:
                     findings.append(
                         ComplianceFinding(
@@ -143,7 +214,7 @@ class DocCrawlerAgent:
                                 f"{doc_type_readable.title()} documents should be reviewed at least "
                                 f"every {threshold.days} days."
                             ),
-                            severity=Severity.MEDIUM if age < threshold * 2 else Severity.HIGH,
+                            severity=Severity.MEDIUM if age < threshold_x2 else Severity.HIGH,
                             frameworks=[ComplianceFramework.SOC2, ComplianceFramework.GDPR],
                             confidence=0.95,
                             metadata={
@@ -157,11 +228,9 @@ class DocCrawlerAgent:
 
         return findings
 
-    def _extract_context(self, content: str, pattern: str, context_chars: int = 200) -> str:
-        """Extract surrounding context for a pattern match."""
-        idx = content.lower().find(pattern.lower())
-        if idx == -1:
-            return ""
-        start = max(0, idx - context_chars)
-        end = min(len(content), idx + len(pattern) + context_chars)
-        return f"...{content[start:end]}..."
+    def _extract_context(
+        self, content: str, pattern: str, match_idx: int, context_chars: int = 200
+    ) -> str:
+        """Extract surrounding context for a pattern match starting at ``match_idx``."""
+        start = max(0, match_idx - context_chars)
+        return f"...{content[start:match_idx + len(pattern) + context_chars]}..."
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
+import operator
 import uuid
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional
 
+import orjson
+
 from src.models.compliance import (
     AgentStatus,
     ComplianceFinding,
@@ -26,6 +32,9 @@ SEVERITY_WEIGHTS = {
     Severity.CRITICAL: 15.0,
 }
 
+# Frameworks in declaration order, so risk scoring does not iterate the enum class
+_ALL_FRAMEWORKS: tuple[ComplianceFramework, ...] = tuple(ComplianceFramework)
+
 # Thresholds for HITL triggers
 HITL_THRESHOLD_SCORE = 50.0  # Overall risk score that triggers HITL
 HITL_THRESHOLD_CRITICAL = 1  # Number of critical findings that triggers HITL
@@ -36,21 +45,64 @@ class OrchestratorAgent:
 
     def __init__(self):
         self.findings: list[ComplianceFinding] = []
+        self._finding_by_id: dict[str, ComplianceFinding] = {}
         self.reviews: list[HITLReview] = []
+        self._reviews_by_id: dict[str, HITLReview] = {}
+        self._pending_reviews: dict[str, HITLReview] = {}  # insertion-ordered set of pending
         self.agent_statuses: dict[str, AgentStatus] = {}
         self._current_risk: Optional[RiskScore] = None
+        # JSON for findings, agent statuses and the risk score, serialized once when they change
+        self._finding_json: dict[str, bytes] = {}
+        self._status_json: dict[str, str] = {}
+        self._risk_json: Optional[bytes] = None
+        # Encoded dashboard summary; cleared whenever findings, reviews or agent statuses change
+        self._dashboard_json: Optional[bytes] = None
+        # Running risk totals, updated incrementally as findings are ingested
+        self._total_weight = 0.0
+        self._fw_weight: defaultdict[ComplianceFramework, float] = defaultdict(float)
+        self._crit_count = 0
+        self._high_count = 0
+        # Findings indexed by severity and framework, in ingest order
+        self._by_severity: defaultdict[Severity, list[ComplianceFinding]] = defaultdict(list)
+        self._by_framework: defaultdict[ComplianceFramework, list[ComplianceFinding]] = (
+            defaultdict(list)
+        )
+        # Whether findings were ingested in detection order, so every index list is
+        # sorted by detected_at_ns and the newest matches can be read off its tail
+        self._ingested_in_time_order = True
+        self._last_detected_ns = 0
 
     def ingest_findings(self, new_findings: list[ComplianceFinding]) -> RiskScore:
         """Ingest new findings from any agent and recalculate risk."""
-        # Deduplicate by ID
-        existing_ids = {f.id for f in self.findings}
-        unique_new = [f for f in new_findings if f.id not in existing_ids]
+        # Deduplicate by ID, against earlier ingests and within this batch
+        unique_new: list[ComplianceFinding] = []
+        for f in new_findings:
+            if f.id in self._finding_by_id:
+                continue
+            self._finding_by_id[f.id] = f
+            unique_new.append(f)
+            w = SEVERITY_WEIGHTS[f.severity] * f.confidence
+            self._total_weight += w
+            if f.severity is Severity.CRITICAL:
+                self._crit_count += 1
+            elif f.severity is Severity.HIGH:
+                self._high_count += 1
+            self._by_severity[f.severity].append(f)
+            if f.detected_at_ns < self._last_detected_ns:
+                self._ingested_in_time_order = False
+            self._last_detected_ns = max(self._last_detected_ns, f.detected_at_ns)
+            self._finding_json[f.id] = f.model_dump_json().encode()
+            for fw in f.frameworks:
+                self._fw_weight[fw] += w
+                self._by_framework[fw].append(f)
 
         self.findings.extend(unique_new)
         logger.info(f"Ingested {len(unique_new)} new findings ({len(new_findings) - len(unique_new)} duplicates skipped)")
 
         # Recalculate risk
         self._current_risk = self._calculate_risk()
+        self._risk_json = None
+        self._dashboard_json = None
 
         # Check HITL triggers
         if self._should_trigger_hitl(unique_new):
@@ -66,14 +118,78 @@ class OrchestratorAgent:
             self._current_risk = self._calculate_risk()
         return self._current_risk
 
+    def get_risk_json(self) -> bytes:
+        """Get current risk score serialized as JSON, cached until the next ingest."""
+        if self._risk_json is None:
+            self._risk_json = self.get_risk_score().model_dump_json().encode()
+        return self._risk_json
+
+    def get_finding_json(self, finding: ComplianceFinding) -> bytes:
+        """Get a finding serialized as JSON, reusing the encoding stored when it was ingested."""
+        if self._finding_by_id.get(finding.id) is finding:
+            return self._finding_json[finding.id]
+        return finding.model_dump_json().encode()
+
+    def query_findings(
+        self,
+        severity: Optional[Severity] = None,
+        framework: Optional[ComplianceFramework] = None,
+        limit: int = 50,
+    ) -> list[ComplianceFinding]:
+        """Get the ``limit`` most recently detected findings matching the filters, newest first.
+
+        Uses the narrower of the severity/framework indexes. While findings have arrived in
+        detection order the index is walked backwards, stopping after ``limit`` matches;
+        otherwise the newest are selected with a bounded heap in O(n log limit).
+        """
+        candidates = self.findings
+        keep = None
+        if severity and framework:
+            by_severity = self._by_severity.get(severity, [])
+            by_framework = self._by_framework.get(framework, [])
+            if len(by_severity) <= len(by_framework):
+                candidates, keep = by_severity, lambda f: framework in f.frameworks
+            else:
+                candidates, keep = by_framework, lambda f: f.severity is severity
+        elif severity:
+            candidates = self._by_severity.get(severity, [])
+        elif framework:
+            candidates = self._by_framework.get(framework, [])
+        limit = max(limit, 0)
+        if self._ingested_in_time_order:
+            return list(itertools.islice(filter(keep, reversed(candidates)), limit))
+        return heapq.nlargest(
+            limit, filter(keep, candidates), key=operator.attrgetter("detected_at_ns")
+        )
+
+    def get_pending_reviews(self) -> list[HITLReview]:
+        """Get HITL reviews still awaiting a decision, oldest first."""
+        return list(self._pending_reviews.values())
+
     def get_dashboard_summary(self) -> dict:
         """Get full dashboard summary."""
-        risk = self.get_risk_score()
         return {
-            "risk": risk.model_dump(),
+            "risk": self.get_risk_score().model_dump(),
             "agents": {name: status.model_dump() for name, status in self.agent_statuses.items()},
-            "recent_findings": [f.model_dump() for f in sorted(self.findings, key=lambda x: x.detected_at, reverse=True)[:10]],
-            "pending_reviews": len([r for r in self.reviews if r.status == "pending"]),
+            "recent_findings": [f.model_dump() for f in self.query_findings(limit=10)],
+            "pending_reviews": len(self._pending_reviews),
+        }
+
+    def get_dashboard_json(self) -> bytes:
+        """Get the dashboard summary encoded as JSON, cached until state changes."""
+        if self._dashboard_json is None:
+            self._dashboard_json = orjson.dumps(self._build_dashboard())
+        return self._dashboard_json
+
+    def _build_dashboard(self) -> dict:
+        """Build the dashboard summary from pre-serialized ``orjson.Fragment`` values."""
+        return {
+            "risk": orjson.Fragment(self.get_risk_json()),
+            "agents": {name: orjson.Fragment(js) for name, js in self._status_json.items()},
+            "recent_findings": [
+                orjson.Fragment(self._finding_json[f.id]) for f in self.query_findings(limit=10)
+            ],
+            "pending_reviews": len(self._pending_reviews),
         }
 
     def update_agent_status(self, agent_name: str, is_active: bool = True, findings_today: int = 0) -> None:
@@ -84,38 +200,31 @@ class OrchestratorAgent:
         status.is_active = is_active
         status.last_heartbeat = datetime.utcnow()
         status.findings_today += findings_today
+        self._status_json[agent_name] = status.model_dump_json()
+        self._dashboard_json = None
 
     def _calculate_risk(self) -> RiskScore:
-        """Calculate overall and per-framework risk scores."""
+        """Calculate overall and per-framework risk scores from the running totals."""
         if not self.findings:
             return RiskScore(overall_score=0.0)
 
         # Overall score: weighted sum of findings, capped at 100
-        total_weight = sum(
-            SEVERITY_WEIGHTS[f.severity] * f.confidence for f in self.findings
-        )
         # Normalize: 100 = 20+ weighted findings
-        overall = min(100.0, (total_weight / 20.0) * 100.0)
+        overall = min(100.0, (self._total_weight / 20.0) * 100.0)
 
         # Per-framework scores
-        framework_scores: dict[ComplianceFramework, float] = {}
-        for framework in ComplianceFramework:
-            framework_findings = [f for f in self.findings if framework in f.frameworks]
-            if framework_findings:
-                fw_weight = sum(
-                    SEVERITY_WEIGHTS[f.severity] * f.confidence for f in framework_findings
-                )
-                framework_scores[framework] = min(100.0, (fw_weight / 10.0) * 100.0)
-
-        critical_count = sum(1 for f in self.findings if f.severity == Severity.CRITICAL)
-        high_count = sum(1 for f in self.findings if f.severity == Severity.HIGH)
+        framework_scores: dict[ComplianceFramework, float] = {
+            framework: min(100.0, (self._fw_weight[framework] / 10.0) * 100.0)
+            for framework in _ALL_FRAMEWORKS
+            if framework in self._fw_weight
+        }
 
         return RiskScore(
             overall_score=round(overall, 1),
             framework_scores=framework_scores,
             findings_count=len(self.findings),
-            critical_count=critical_count,
-            high_count=high_count,
+            critical_count=self._crit_count,
+            high_count=self._high_count,
         )
 
     def _should_trigger_hitl(self, new_findings: list[ComplianceFinding]) -> bool:
@@ -142,17 +251,25 @@ class OrchestratorAgent:
             status="pending",
         )
         self.reviews.append(review)
+        self._reviews_by_id[review.id] = review
+        self._pending_reviews[review.id] = review
+        self._dashboard_json = None
         logger.info(f"HITL review created for finding {finding.id}: {finding.title}")
         return review
 
     def resolve_review(self, review_id: str, status: str, reviewer: str, notes: Optional[str] = None) -> Optional[HITLReview]:
         """Resolve a HITL review."""
-        for review in self.reviews:
-            if review.id == review_id:
-                review.status = status
-                review.reviewer = reviewer
-                review.notes = notes
-                review.resolved_at = datetime.utcnow()
-                logger.info(f"Review {review_id} resolved: {status} by {reviewer}")
-                return review
-        return None
+        review = self._reviews_by_id.get(review_id)
+        if review is None:
+            return None
+        review.status = status
+        review.reviewer = reviewer
+        review.notes = notes
+        review.resolved_at = datetime.utcnow()
+        if status == "pending":
+            self._pending_reviews[review_id] = review
+        else:
+            self._pending_reviews.pop(review_id, None)
+        self._dashboard_json = None
+        logger.info(f"Review {review_id} resolved: {status} by {reviewer}")
+        return review
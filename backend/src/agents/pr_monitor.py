@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+from collections import OrderedDict
 from typing import Optional
 
+import ahocorasick
 import httpx
 
+from src.agents.text import ascii_lower, compile_literals, scan_literals
 from src.models.compliance import (
     ComplianceFinding,
     ComplianceFramework,
@@ -39,11 +44,139 @@ COMPLIANCE_PATTERNS = {
     ],
 }
 
+# Pattern severities; anything not listed is MEDIUM
+_CRITICAL = frozenset({"ssn", "social_security", "credit_card", "card_number", "api_key", "secret"})
+_HIGH = frozenset({"password", "credential", "patient", "phi", "personal_data"})
+_PATTERN_SEVERITY: dict[str, Severity] = {p: Severity.CRITICAL for p in _CRITICAL} | {
+    p: Severity.HIGH for p in _HIGH
+}
+
+# Single-pass matcher over every framework pattern; a pattern shared by several
+# frameworks maps to all of them
+_PR_AC = ahocorasick.Automaton()
+for _framework, _patterns in COMPLIANCE_PATTERNS.items():
+    for _pattern in _patterns:
+        _key = _pattern.lower()
+        _PR_AC.add_word(_key, _PR_AC.get(_key, ()) + ((_framework, _pattern),))
+_PR_AC.make_automaton()
+
+# With hyperscan installed, all patterns are also compiled into one SIMD DFA for
+# ASCII diffs; pattern id i reports _PR_PATTERN_IDS[i]
+_PR_PATTERN_IDS: tuple[tuple[ComplianceFramework, str], ...] = tuple(
+    (framework, pattern)
+    for framework, patterns in COMPLIANCE_PATTERNS.items()
+    for pattern in patterns
+)
+_PR_HS_DB = compile_literals((pattern for _, pattern in _PR_PATTERN_IDS), start_of_match=True)
+
 # High-risk file patterns
 HIGH_RISK_PATHS = [
     "auth/", "security/", "encryption/", "privacy/",
     ".env", "config/secrets", "middleware/auth",
 ]
+_HIGH_RISK_RE = re.compile("|".join(re.escape(p) for p in HIGH_RISK_PATHS))
+
+# Ceiling on in-flight GitHub API requests across all PR analyses
+GITHUB_MAX_CONCURRENCY = 10
+
+# Number of PRs whose scan results and file list are kept for re-scans of an unchanged head
+PR_CACHE_SIZE = 1024
+
+# Diffs are streamed and scanned in chunks of this many characters, never held whole in memory
+DIFF_CHUNK_SIZE = 1 << 16
+
+# A (framework, pattern, context) hit from scanning a PR diff
+DiffHit = tuple[ComplianceFramework, str, str]
+
+
+def _find_newlines(text: str, pos: int, count: int) -> tuple[int, int]:
+    """Find the ``count``-th newline at or after ``pos``.
+
+    Returns ``(offset, found)``; if fewer than ``count`` newlines remain, ``offset`` is
+    ``len(text)`` and ``found`` is how many there were.
+    """
+    end = pos - 1
+    for found in range(count):
+        end = text.find("\n", end + 1)
+        if end == -1:
+            return len(text), found
+    return end, count
+
+
+class _DiffScanner:
+    """Incremental compliance-pattern scan over a diff that arrives in chunks.
+
+    Text is scanned in line-aligned blocks: no pattern contains a newline, so no match can
+    straddle two blocks. Between blocks only the unfinished last line, the last
+    ``context_lines`` lines and the contexts still waiting for lines below their match are
+    kept, so memory is bounded by the chunk size plus a few lines rather than the diff size.
+    """
+
+    def __init__(self, scan, context_lines: int = 3):
+        self._scan = scan  # (text, seen) -> [(offset, framework, pattern)]
+        self._context_lines = context_lines
+        self._seen: set[tuple[ComplianceFramework, str]] = set()
+        self._carry: list[str] = []  # pieces of the trailing partial line, joined once
+        # its newline arrives so a long line is not re-copied on every chunk
+        self._tail = ""  # last `context_lines` lines already scanned
+        self._hits: list[tuple[ComplianceFramework, str, list[str]]] = []
+        self._pending: list[list] = []  # [context parts, newlines still needed]
+
+    def feed(self, text: str) -> None:
+        cut = text.rfind("\n") + 1
+        if not cut:
+            if text:
+                self._carry.append(text)
+            return
+        self._carry.append(text[:cut])
+        block = "".join(self._carry)
+        self._carry = [text[cut:]] if cut < len(text) else []
+        self._process(block)
+
+    def close(self) -> list[DiffHit]:
+        if self._carry:
+            self._process("".join(self._carry))
+            self._carry = []
+        return [(framework, pattern, "".join(parts)) for framework, pattern, parts in self._hits]
+
+    def _process(self, block: str) -> None:
+        window = self._tail + block
+        base = len(self._tail)
+
+        # Extend contexts still waiting for the lines below their match
+        still_pending = []
+        for entry in self._pending:
+            parts, needed = entry
+            end, found = _find_newlines(window, base, needed)
+            parts.append(window[base:end])
+            if found < needed:
+                entry[1] = needed - found
+                still_pending.append(entry)
+        self._pending = still_pending
+
+        for offset, framework, pattern in self._scan(block, self._seen):
+            idx = base + offset
+            # Walk back to the start of the line `context_lines` above the match...
+            start = idx
+            for _ in range(self._context_lines + 1):
+                start = window.rfind("\n", 0, start)
+                if start == -1:
+                    break
+            start += 1
+            # ...and forward to the end of the line `context_lines` below it, which may
+            # only arrive with a later block
+            end, found = _find_newlines(window, idx, self._context_lines + 1)
+            parts = [window[start:end]]
+            self._hits.append((framework, pattern, parts))
+            if found <= self._context_lines:
+                self._pending.append([parts, self._context_lines + 1 - found])
+
+        cut = len(window) - 1
+        for _ in range(self._context_lines):
+            cut = window.rfind("\n", 0, cut)
+            if cut == -1:
+                break
+        self._tail = window[cut + 1:]
 
 
 class PRMonitorAgent:
@@ -51,103 +184,185 @@ class PRMonitorAgent:
 
     def __init__(self, github_token: Optional[str] = None):
         self.github_token = github_token
+        self._sem = asyncio.Semaphore(GITHUB_MAX_CONCURRENCY)
         self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=50, keepalive_expiry=60
+            ),
             headers={"Authorization": f"token {github_token}"} if github_token else {},
             timeout=30.0,
         )
+        # (owner, repo, pr_number) -> (etag, head_sha, diff hits, files), least recently used first
+        self._pr_cache: OrderedDict[
+            tuple[str, str, int], tuple[str, str, list[DiffHit], list[str]]
+        ] = OrderedDict()
 
     async def analyze_pr(self, owner: str, repo: str, pr_number: int) -> list[ComplianceFinding]:
         """Analyze a single PR for compliance issues."""
         findings: list[ComplianceFinding] = []
 
-        # Fetch PR diff
-        diff = await self._fetch_pr_diff(owner, repo, pr_number)
-        if not diff:
-            return findings
-
-        # Scan for compliance patterns
-        for framework, patterns in COMPLIANCE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern.lower() in diff.lower():
-                    finding = ComplianceFinding(
-                        id=f"pr-{owner}-{repo}-{pr_number}-{framework.value}-{pattern}",
-                        source=SignalSource.GITHUB_PR,
-                        source_url=f"https://github.com/{owner}/{repo}/pull/{pr_number}",
-                        title=f"Potential {framework.value.upper()} relevance: '{pattern}' found in PR #{pr_number}",
-                        description=f"The pattern '{pattern}' was detected in PR #{pr_number} of {owner}/{repo}. "
-                        f"This may indicate changes relevant to {framework.value.upper()} compliance.",
-                        severity=self._assess_severity(pattern, framework),
-                        frameworks=[framework],
-                        confidence=0.7,
-                        raw_content=self._extract_context(diff, pattern),
-                    )
-                    findings.append(finding)
+        hits, files = await self._fetch_pr_content(owner, repo, pr_number)
+
+        # Compliance patterns found while streaming the diff
+        for framework, pattern, context in hits or ():
+            finding = ComplianceFinding(
+                id=f"pr-{owner}-{repo}-{pr_number}-{framework.value}-{pattern}",
+                source=SignalSource.GITHUB_PR,
+                source_url=f"https://github.com/{owner}/{repo}/pull/{pr_number}",
+                title=f"Potential {framework.value.upper()} relevance: '{pattern}' found in PR #{pr_number}",
+                description=f"The pattern '{pattern}' was detected in PR #{pr_number} of {owner}/{repo}. "
+                f"This may indicate changes relevant to {framework.value.upper()} compliance.",
+                severity=self._assess_severity(pattern, framework),
+                frameworks=[framework],
+                confidence=0.7,
+                raw_content=context,
+            )
+            findings.append(finding)
 
         # Check high-risk file paths
-        files = await self._fetch_pr_files(owner, repo, pr_number)
-        for file_path in files:
-            for risk_path in HIGH_RISK_PATHS:
-                if risk_path in file_path:
-                    finding = ComplianceFinding(
-                        id=f"pr-{owner}-{repo}-{pr_number}-highrisk-{file_path}",
-                        source=SignalSource.GITHUB_PR,
-                        source_url=f"https://github.com/{owner}/{repo}/pull/{pr_number}",
-                        title=f"High-risk file modified: {file_path}",
-                        description=f"File '{file_path}' in a security/compliance-sensitive path was modified.",
-                        severity=Severity.HIGH,
-                        frameworks=[],
-                        confidence=0.8,
-                    )
-                    findings.append(finding)
+        for file_path in files or ():
+            m = _HIGH_RISK_RE.search(file_path)
+            if m:
+                finding = ComplianceFinding(
+                    id=f"pr-{owner}-{repo}-{pr_number}-highrisk-{file_path}",
+                    source=SignalSource.GITHUB_PR,
+                    source_url=f"https://github.com/{owner}/{repo}/pull/{pr_number}",
+                    title=f"High-risk file modified: {file_path}",
+                    description=f"File '{file_path}' in a security/compliance-sensitive path was modified.",
+                    severity=Severity.HIGH,
+                    frameworks=[],
+                    confidence=0.8,
+                    metadata={"risk_path": m.group(0)},
+                )
+                findings.append(finding)
 
         logger.info(f"PR #{pr_number}: {len(findings)} compliance findings")
         return findings
 
-    async def _fetch_pr_diff(self, owner: str, repo: str, pr_number: int) -> Optional[str]:
-        """Fetch the diff content of a PR."""
+    async def _fetch_pr_content(
+        self, owner: str, repo: str, pr_number: int
+    ) -> tuple[Optional[list[DiffHit]], Optional[list[str]]]:
+        """Scan a PR's diff and fetch its files, reusing both while its head SHA is unchanged.
+
+        Either result is ``None`` if its fetch failed; results are only cached when both
+        succeeded, so a transient failure is retried on the next scan.
+        """
+        key = (owner, repo, pr_number)
+        cached = self._pr_cache.get(key)
+        # The head is read before the diff and files, never alongside them: a push landing
+        # in between then only costs a refetch, instead of caching the old diff's hits
+        # under the new SHA
+        head = await self._fetch_pr_head(owner, repo, pr_number, cached[0] if cached else None)
+        if cached and head and head[1] == cached[1]:
+            self._pr_cache[key] = (head[0], *cached[1:])
+            self._pr_cache.move_to_end(key)
+            return cached[2], cached[3]
+
+        # Scan PR diff and fetch changed files concurrently; each fetch returns None on
+        # failure, so one can succeed without the other
+        hits, files = await asyncio.gather(
+            self._scan_pr_diff(owner, repo, pr_number),
+            self._fetch_pr_files(owner, repo, pr_number),
+        )
+        if head and hits is not None and files is not None:
+            self._pr_cache[key] = (head[0], head[1], hits, files)
+            self._pr_cache.move_to_end(key)
+            if len(self._pr_cache) > PR_CACHE_SIZE:
+                self._pr_cache.popitem(last=False)
+        return hits, files
+
+    async def _fetch_pr_head(
+        self, owner: str, repo: str, pr_number: int, etag: Optional[str] = None
+    ) -> Optional[tuple[str, str]]:
+        """Fetch a PR's (etag, head SHA).
+
+        Sends ``If-None-Match`` when an etag is known; GitHub answers an unchanged PR
+        with 304, which does not count against the rate limit.
+        """
+        key = (owner, repo, pr_number)
         try:
-            resp = await self.client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
-                headers={"Accept": "application/vnd.github.v3.diff"},
-            )
+            async with self._sem:
+                resp = await self.client.get(
+                    f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
+                    headers={"If-None-Match": etag} if etag else {},
+                )
+            if resp.status_code == 304 and key in self._pr_cache:
+                return self._pr_cache[key][:2]
             resp.raise_for_status()
-            return resp.text
+            return resp.headers.get("ETag", ""), resp.json()["head"]["sha"]
+        except Exception as e:
+            logger.error(f"Failed to fetch PR head: {e}")
+            return None
+
+    async def _scan_pr_diff(
+        self, owner: str, repo: str, pr_number: int
+    ) -> Optional[list[DiffHit]]:
+        """Stream the diff of a PR and scan it for compliance patterns as it arrives."""
+        scanner = _DiffScanner(self._scan_diff)
+        try:
+            async with self._sem:
+                async with self.client.stream(
+                    "GET",
+                    f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
+                    headers={"Accept": "application/vnd.github.v3.diff"},
+                ) as resp:
+                    resp.raise_for_status()
+                    async for chunk in resp.aiter_text(DIFF_CHUNK_SIZE):
+                        scanner.feed(chunk)
         except Exception as e:
             logger.error(f"Failed to fetch PR diff: {e}")
             return None
+        return scanner.close()
 
-    async def _fetch_pr_files(self, owner: str, repo: str, pr_number: int) -> list[str]:
-        """Fetch list of files changed in a PR."""
+    async def _fetch_pr_files(
+        self, owner: str, repo: str, pr_number: int
+    ) -> Optional[list[str]]:
+        """Fetch list of files changed in a PR, or ``None`` if the request failed."""
         try:
-            resp = await self.client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/files"
-            )
+            async with self._sem:
+                resp = await self.client.get(
+                    f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/files"
+                )
             resp.raise_for_status()
             return [f["filename"] for f in resp.json()]
         except Exception as e:
             logger.error(f"Failed to fetch PR files: {e}")
-            return []
+            return None
+
+    def _scan_diff(
+        self, text: str, seen: set[tuple[ComplianceFramework, str]]
+    ) -> list[tuple[int, ComplianceFramework, str]]:
+        """Find the first occurrence of each compliance pattern not yet in ``seen``.
+
+        Returns ``(offset, framework, pattern)`` tuples and adds them to ``seen``.
+        """
+        hits: list[tuple[int, ComplianceFramework, str]] = []
+        first: dict[int, int] = {}
+
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context) -> None:
+            if pattern_id not in first:
+                first[pattern_id] = start
+
+        if scan_literals(_PR_HS_DB, text, on_match):
+            for pattern_id, start in first.items():
+                framework, pattern = _PR_PATTERN_IDS[pattern_id]
+                if (framework, pattern) not in seen:
+                    seen.add((framework, pattern))
+                    hits.append((start, framework, pattern))
+            return hits
+
+        for end_idx, matches in _PR_AC.iter(ascii_lower(text)):
+            for framework, pattern in matches:
+                if (framework, pattern) in seen:
+                    continue  # One finding per pattern per PR
+                seen.add((framework, pattern))
+                hits.append((end_idx - len(pattern) + 1, framework, pattern))
+        return hits
 
     def _assess_severity(self, pattern: str, framework: ComplianceFramework) -> Severity:
         """Assess severity based on pattern and framework."""
-        critical_patterns = {"ssn", "social_security", "credit_card", "card_number", "api_key", "secret"}
-        high_patterns = {"password", "credential", "patient", "phi", "personal_data"}
-
-        if pattern in critical_patterns:
-            return Severity.CRITICAL
-        if pattern in high_patterns:
-            return Severity.HIGH
-        return Severity.MEDIUM
-
-    def _extract_context(self, diff: str, pattern: str, context_lines: int = 3) -> str:
-        """Extract surrounding context for a pattern match in a diff."""
-        lines = diff.split("\n")
-        for i, line in enumerate(lines):
-            if pattern.lower() in line.lower():
-                start = max(0, i - context_lines)
-                end = min(len(lines), i + context_lines + 1)
-                return "\n".join(lines[start:end])
-        return ""
+        return _PATTERN_SEVERITY.get(pattern, Severity.MEDIUM)
 
     async def close(self):
         await self.client.aclose()
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import bisect
 import logging
+import sys
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import NamedTuple, Optional
 
+import ahocorasick
+
+from src.agents.text import ascii_lower, compile_literals, scan_literals
 from src.models.compliance import (
     ComplianceFinding,
     ComplianceFramework,
@@ -50,59 +57,211 @@ POLICY_PATTERNS = {
 }
 
 
+class _PatternRow(NamedTuple):
+    """A policy pattern with the finding strings that are constant across messages."""
+
+    name: str
+    keywords: tuple[str, ...]
+    title: str
+    description_suffix: str
+    frameworks: tuple[ComplianceFramework, ...]
+    severity: Severity
+
+
+# POLICY_PATTERNS as flat records, derived once at import
+_PATTERNS: tuple[_PatternRow, ...] = tuple(
+    _PatternRow(
+        name=name,
+        keywords=tuple(c["keywords"]),
+        title=f"Policy-relevant conversation: {name.replace('_', ' ').title()}",
+        description_suffix=(
+            f"This may relate to {', '.join(f.value.upper() for f in c['frameworks'])} compliance."
+        ),
+        frameworks=tuple(c["frameworks"]),
+        severity=c["severity"],
+    )
+    for name, c in POLICY_PATTERNS.items()
+)
+
+# Flat (keyword_lower, pattern, keyword) table over every policy keyword
+_FLAT_KEYWORDS: tuple[tuple[str, _PatternRow, str], ...] = tuple(
+    (keyword.lower(), row, keyword) for row in _PATTERNS for keyword in row.keywords
+)
+
+# Single-pass matcher over the flat keyword table
+_AC = ahocorasick.Automaton()
+for _keyword_lower, _row, _keyword in _FLAT_KEYWORDS:
+    _AC.add_word(_keyword_lower, (_row, _keyword))
+_AC.make_automaton()
+
+# With hyperscan installed, the keywords are also compiled into one SIMD DFA for ASCII
+# batches; expression id i reports _FLAT_KEYWORDS[i]
+_HS_DB = compile_literals(keyword_lower for keyword_lower, _, _ in _FLAT_KEYWORDS)
+
+# Joins batched message texts for a single scan; no keyword contains it
+_MESSAGE_SEPARATOR = "\x01"
+
+# (pattern, first keyword) per matched pattern of one message, in order of occurrence
+MessageHits = tuple[tuple[_PatternRow, str], ...]
+
+# Number of message texts whose keyword hits are kept for reposts of the same text
+MATCH_CACHE_SIZE = 4096
+
+# Longer texts are scanned every time rather than held as cache keys
+MATCH_CACHE_MAX_TEXT_LEN = 4096
+
+
 class SlackMonitorAgent:
     """Monitors Slack messages for compliance-relevant conversations."""
 
     def __init__(self, slack_token: Optional[str] = None):
         self.slack_token = slack_token
+        # Message text -> its keyword hits, least recently used first; reposted and echoed
+        # messages skip the scan. Guarded by a lock as analysis runs on worker threads.
+        self._match_cache: OrderedDict[str, MessageHits] = OrderedDict()
+        self._match_cache_lock = threading.Lock()
 
-    async def analyze_message(
+    def analyze_message(
         self, channel: str, user: str, text: str, timestamp: str
     ) -> list[ComplianceFinding]:
-        """Analyze a single Slack message for compliance signals."""
-        findings: list[ComplianceFinding] = []
-        text_lower = text.lower()
-
-        for pattern_name, config in POLICY_PATTERNS.items():
-            for keyword in config["keywords"]:
-                if keyword.lower() in text_lower:
-                    finding = ComplianceFinding(
-                        id=f"slack-{channel}-{timestamp}-{pattern_name}",
-                        source=SignalSource.SLACK_MESSAGE,
-                        source_url=None,
-                        title=f"Policy-relevant conversation: {pattern_name.replace('_', ' ').title()}",
-                        description=(
-                            f"Keyword '{keyword}' detected in #{channel} by {user}. "
-                            f"This may relate to {', '.join(f.value.upper() for f in config['frameworks'])} compliance."
-                        ),
-                        severity=config["severity"],
-                        frameworks=config["frameworks"],
-                        confidence=0.6,
-                        raw_content=text[:500],
-                        metadata={
-                            "channel": channel,
-                            "user": user,
-                            "pattern": pattern_name,
-                            "keyword": keyword,
-                        },
-                    )
-                    findings.append(finding)
-                    break  # One finding per pattern per message
-
-        logger.info(f"Slack message in #{channel}: {len(findings)} compliance findings")
+        """Analyze a single Slack message for compliance signals.
+
+        Scanning is CPU-bound, so async callers should run it off the event loop, e.g. with
+        ``asyncio.to_thread``.
+        """
+        findings = self._scan_messages([(channel, user, text, timestamp)])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Slack message in #{channel}: {len(findings)} compliance findings")
         return findings
 
-    async def analyze_batch(
+    def analyze_batch(
         self, messages: list[dict]
     ) -> list[ComplianceFinding]:
-        """Analyze a batch of Slack messages."""
-        all_findings: list[ComplianceFinding] = []
-        for msg in messages:
-            findings = await self.analyze_message(
-                channel=msg.get("channel", "unknown"),
-                user=msg.get("user", "unknown"),
-                text=msg.get("text", ""),
-                timestamp=msg.get("ts", str(datetime.utcnow().timestamp())),
+        """Analyze a batch of Slack messages.
+
+        Messages without a ``ts`` get ``"<batch time>-<index>"``, so the clock is read once
+        per batch and their finding IDs stay distinct.
+        """
+        batch_ts = str(datetime.utcnow().timestamp())
+        findings = self._scan_messages(
+            [
+                (
+                    msg.get("channel", "unknown"),
+                    msg.get("user", "unknown"),
+                    msg.get("text", ""),
+                    msg.get("ts") or f"{batch_ts}-{i}",
+                )
+                for i, msg in enumerate(messages)
+            ]
+        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Slack batch of {len(messages)} messages: {len(findings)} compliance findings"
             )
-            all_findings.extend(findings)
-        return all_findings
+        return findings
+
+    def _scan_messages(
+        self, messages: list[tuple[str, str, str, str]]
+    ) -> list[ComplianceFinding]:
+        """Build findings for ``(channel, user, text, timestamp)`` messages."""
+        msg_hits = self._match_messages([text for _, _, text, _ in messages])
+        if not any(msg_hits):
+            return []  # Most messages match nothing; skip the bookkeeping below
+
+        # Every field comes from trusted constants or the message itself, so findings are
+        # built with model_construct to skip Pydantic validation on this hot path
+        findings: list[ComplianceFinding] = []
+        for (channel, user, text, timestamp), hits in zip(messages, msg_hits):
+            if not hits:
+                continue
+            # Channel and user IDs repeat across many findings; share one string per value.
+            # Pattern names and keywords already come from the shared constant tables.
+            channel, user = sys.intern(channel), sys.intern(user)
+            preview = text[:500]  # raw_content, shared by the message's findings
+            for row, keyword in hits:
+                finding = ComplianceFinding.model_construct(
+                    id=f"slack-{channel}-{timestamp}-{row.name}",
+                    source=SignalSource.SLACK_MESSAGE,
+                    source_url=None,
+                    title=row.title,
+                    description=(
+                        f"Keyword '{keyword}' detected in #{channel} by {user}. "
+                        + row.description_suffix
+                    ),
+                    severity=row.severity,
+                    frameworks=list(row.frameworks),
+                    confidence=0.6,
+                    raw_content=preview,
+                    metadata={
+                        "channel": channel,
+                        "user": user,
+                        "pattern": row.name,
+                        "keyword": keyword,
+                    },
+                )
+                findings.append(finding)
+        return findings
+
+    def _match_messages(self, texts: list[str]) -> list[MessageHits]:
+        """Get the first keyword hit per pattern for each text, in order of occurrence.
+
+        Texts seen recently are answered from the match cache. The rest are joined with a
+        separator no keyword contains, so no match spans two messages, and scanned in one
+        pass; each match end offset is mapped back to its message by bisection.
+        """
+        msg_hits: list[Optional[MessageHits]] = [None] * len(texts)
+        misses: list[int] = []
+        with self._match_cache_lock:
+            for i, text in enumerate(texts):
+                cached = self._match_cache.get(text)
+                if cached is None:
+                    misses.append(i)
+                else:
+                    self._match_cache.move_to_end(text)
+                    msg_hits[i] = cached
+        if not misses:
+            return msg_hits
+
+        starts: list[int] = []
+        offset = 0
+        for i in misses:
+            starts.append(offset)
+            offset += len(texts[i]) + len(_MESSAGE_SEPARATOR)
+        joined = _MESSAGE_SEPARATOR.join(texts[i] for i in misses)
+
+        found: list[list[tuple[_PatternRow, str]]] = [[] for _ in misses]
+        seen: set[tuple[int, str]] = set()
+        for end_idx, row, keyword in self._match_keywords(joined):
+            miss_idx = bisect.bisect_right(starts, end_idx) - 1
+            if (miss_idx, row.name) in seen:
+                continue  # One finding per pattern per message
+            seen.add((miss_idx, row.name))
+            found[miss_idx].append((row, keyword))
+
+        with self._match_cache_lock:
+            for i, hits in zip(misses, found):
+                msg_hits[i] = tuple(hits)
+                if len(texts[i]) <= MATCH_CACHE_MAX_TEXT_LEN:
+                    self._match_cache[texts[i]] = msg_hits[i]
+                    self._match_cache.move_to_end(texts[i])
+            while len(self._match_cache) > MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+        return msg_hits
+
+    def _match_keywords(self, text: str) -> list[tuple[int, _PatternRow, str]]:
+        """Find every policy keyword in ``text`` as ``(end_idx, pattern, keyword)``.
+
+        Matches are ordered by end offset.
+        """
+        hits: list[tuple[int, _PatternRow, str]] = []
+
+        def on_match(keyword_id: int, start: int, end: int, flags: int, context) -> None:
+            _, row, keyword = _FLAT_KEYWORDS[keyword_id]
+            hits.append((end - 1, row, keyword))
+
+        if scan_literals(_HS_DB, text, on_match):
+            return hits
+
+        return [
+            (end_idx, row, keyword) for end_idx, (row, keyword) in _AC.iter(ascii_lower(text))
+        ]
@@ -0,0 +1,77 @@
+"""Text helpers shared by the monitoring agents."""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Callable, Iterable
+
+try:
+    import hyperscan
+except ImportError:  # optional accelerator; scans fall back to Aho-Corasick
+    hyperscan = None
+
+# Byte table that maps A-Z to a-z and leaves every other byte alone
+_ASCII_LOWER = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
+
+def ascii_lower(text: str) -> str:
+    """Lowercase the ASCII letters in ``text`` and leave every other character untouched.
+
+    All agent patterns are ASCII, so this is all case-insensitive matching needs. Unlike
+    ``str.lower()``, which can lengthen some non-ASCII characters, it never changes the
+    string's length, so match offsets found in the result index ``text`` directly.
+    """
+    if text.isascii():
+        return text.lower()
+    return (
+        text.encode("utf-8", "surrogatepass")
+        .translate(_ASCII_LOWER)
+        .decode("utf-8", "surrogatepass")
+    )
+
+
+# Hyperscan scratch space cannot be shared between concurrent scans, so each thread keeps
+# its own per database
+_hs_local = threading.local()
+
+
+def compile_literals(literals: Iterable[str], start_of_match: bool = False):
+    """Compile ``literals`` into one caseless hyperscan database, or ``None`` without hyperscan.
+
+    Expression id ``i`` reports the ``i``-th literal. With ``start_of_match`` the match
+    handler receives the leftmost start offset; otherwise its ``start`` argument is 0.
+    """
+    if hyperscan is None:
+        return None
+    literals = list(literals)
+    flags = hyperscan.HS_FLAG_CASELESS
+    if start_of_match:
+        flags |= hyperscan.HS_FLAG_SOM_LEFTMOST
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(literal).encode() for literal in literals],
+        ids=list(range(len(literals))),
+        flags=[flags] * len(literals),
+    )
+    return db
+
+
+def scan_literals(db, text: str, on_match: Callable[..., None]) -> bool:
+    """Scan ``text`` with a ``compile_literals`` database if possible.
+
+    Hyperscan matches bytes, so only ASCII text, whose byte offsets equal its string
+    offsets, is scanned. ``on_match(id, start, end, flags, context)`` is called per match,
+    in order of end offset. Returns ``False`` without scanning when ``db`` is ``None`` or
+    ``text`` is not ASCII; callers then scan with their Aho-Corasick automaton instead.
+    """
+    if db is None or not text.isascii():
+        return False
+    scratches = getattr(_hs_local, "scratches", None)
+    if scratches is None:
+        scratches = _hs_local.scratches = {}
+    scratch = scratches.get(id(db))
+    if scratch is None:
+        scratch = scratches[id(db)] = hyperscan.Scratch(db)
+    db.scan(text.encode("ascii"), match_event_handler=on_match, scratch=scratch)
+    return True
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Optional
 
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, field_validator
 
 from src.agents.orchestrator import OrchestratorAgent
 from src.agents.pr_monitor import PRMonitorAgent
 from src.agents.slack_monitor import SlackMonitorAgent
 from src.agents.doc_crawler import DocCrawlerAgent
-from src.models.compliance import ComplianceFramework, Severity
+from src.models.compliance import ComplianceFinding, ComplianceFramework, Severity
 
 # Global agent instances
 orchestrator = OrchestratorAgent()
@@ -62,6 +67,12 @@ class AnalyzeSlackRequest(BaseModel):
     text: str
     timestamp: str = ""
 
+    @field_validator("channel", "user")
+    @classmethod
+    def _intern(cls, v: str) -> str:
+        # Channel and user IDs repeat across requests and end up in finding metadata
+        return sys.intern(v)
+
 
 class AnalyzeDocRequest(BaseModel):
     doc_id: str
@@ -76,6 +87,43 @@ class ResolveReviewRequest(BaseModel):
     notes: Optional[str] = None
 
 
+# Larger /findings pages are streamed in chunks of about this many bytes
+STREAM_CHUNK_SIZE = 1 << 16
+
+
+async def _stream_json_array(items: list[bytes]) -> AsyncIterator[bytes]:
+    """Yield pre-serialized JSON items as one JSON array, in ~STREAM_CHUNK_SIZE chunks."""
+    parts = [b"["]
+    size = 1
+    for i, item in enumerate(items):
+        if i:
+            parts.append(b",")
+        parts.append(item)
+        size += len(item) + 1
+        if size >= STREAM_CHUNK_SIZE:
+            yield b"".join(parts)
+            parts, size = [], 0
+    parts.append(b"]")
+    yield b"".join(parts)
+
+
+def _json_array_response(items: list[bytes]) -> Response:
+    """Respond with pre-serialized JSON items as one array, streaming only large bodies."""
+    if sum(map(len, items)) + len(items) + 1 < STREAM_CHUNK_SIZE:
+        return Response(b"[" + b",".join(items) + b"]", media_type="application/json")
+    return StreamingResponse(_stream_json_array(items), media_type="application/json")
+
+
+def _analysis_response(findings: list[ComplianceFinding]) -> Response:
+    """Build the response body shared by the /analyze endpoints."""
+    body = {
+        "findings_count": len(findings),
+        "risk_score": orjson.Fragment(orchestrator.get_risk_json()),
+        "findings": [orjson.Fragment(orchestrator.get_finding_json(f)) for f in findings],
+    }
+    return Response(orjson.dumps(body), media_type="application/json")
+
+
 # --- Endpoints ---
 
 @app.get("/")
@@ -91,13 +139,13 @@ async def health():
 @app.get("/dashboard")
 async def dashboard():
     """Get full dashboard summary."""
-    return orchestrator.get_dashboard_summary()
+    return Response(orchestrator.get_dashboard_json(), media_type="application/json")
 
 
 @app.get("/risk")
 async def risk_score():
     """Get current risk score."""
-    return orchestrator.get_risk_score().model_dump()
+    return Response(orchestrator.get_risk_json(), media_type="application/json")
 
 
 @app.get("/findings")
@@ -106,44 +154,29 @@ async def list_findings(
     framework: Optional[ComplianceFramework] = None,
     limit: int = 50,
 ):
-    """List findings with optional filters."""
-    findings = orchestrator.findings
-
-    if severity:
-        findings = [f for f in findings if f.severity == severity]
-    if framework:
-        findings = [f for f in findings if framework in f.frameworks]
-
-    findings = sorted(findings, key=lambda x: x.detected_at, reverse=True)[:limit]
-    return [f.model_dump() for f in findings]
+    """List findings with optional filters; large pages are streamed rather than buffered."""
+    findings = orchestrator.query_findings(severity, framework, limit)
+    return _json_array_response([orchestrator.get_finding_json(f) for f in findings])
 
 
 @app.post("/analyze/pr")
 async def analyze_pr(req: AnalyzePRRequest):
     """Analyze a GitHub PR for compliance issues."""
     findings = await pr_monitor.analyze_pr(req.owner, req.repo, req.pr_number)
-    risk = orchestrator.ingest_findings(findings)
+    orchestrator.ingest_findings(findings)
     orchestrator.update_agent_status("pr_monitor", is_active=True, findings_today=len(findings))
-    return {
-        "findings_count": len(findings),
-        "risk_score": risk.model_dump(),
-        "findings": [f.model_dump() for f in findings],
-    }
+    return _analysis_response(findings)
 
 
 @app.post("/analyze/slack")
 async def analyze_slack(req: AnalyzeSlackRequest):
     """Analyze a Slack message for compliance signals."""
-    findings = await slack_monitor.analyze_message(
-        req.channel, req.user, req.text, req.timestamp
+    findings = await asyncio.to_thread(
+        slack_monitor.analyze_message, req.channel, req.user, req.text, req.timestamp
     )
-    risk = orchestrator.ingest_findings(findings)
+    orchestrator.ingest_findings(findings)
     orchestrator.update_agent_status("slack_monitor", is_active=True, findings_today=len(findings))
-    return {
-        "findings_count": len(findings),
-        "risk_score": risk.model_dump(),
-        "findings": [f.model_dump() for f in findings],
-    }
+    return _analysis_response(findings)
 
 
 @app.post("/analyze/document")
@@ -155,21 +188,20 @@ async def analyze_document(req: AnalyzeDocRequest):
         content=req.content,
         doc_url=req.doc_url,
     )
-    risk = orchestrator.ingest_findings(findings)
+    orchestrator.ingest_findings(findings)
     orchestrator.update_agent_status("doc_crawler", is_active=True, findings_today=len(findings))
-    return {
-        "findings_count": len(findings),
-        "risk_score": risk.model_dump(),
-        "findings": [f.model_dump() for f in findings],
-    }
+    return _analysis_response(findings)
 
 
 @app.get("/reviews")
 async def list_reviews(status: Optional[str] = None):
     """List HITL reviews."""
-    reviews = orchestrator.reviews
-    if status:
-        reviews = [r for r in reviews if r.status == status]
+    if status == "pending":
+        reviews = orchestrator.get_pending_reviews()
+    elif status:
+        reviews = [r for r in orchestrator.reviews if r.status == status]
+    else:
+        reviews = orchestrator.reviews
     return [r.model_dump() for r in reviews]
 
 
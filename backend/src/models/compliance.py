@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field, model_validator
+
+_EPOCH = datetime(1970, 1, 1)
 
 
 class Severity(str, Enum):
@@ -41,10 +44,37 @@ class ComplianceFinding(BaseModel):
     severity: Severity
     frameworks: list[ComplianceFramework] = Field(default_factory=list)
     confidence: float = Field(ge=0.0, le=1.0, description="Agent confidence 0-1")
-    detected_at: datetime = Field(default_factory=datetime.utcnow)
+    # Internal sort key; excluded from JSON, where 19-digit integers lose precision
+    detected_at_ns: int = Field(
+        default_factory=time.time_ns,
+        exclude=True,
+        description="Detection time, nanoseconds since the epoch",
+    )
     raw_content: Optional[str] = None
     metadata: dict = Field(default_factory=dict)
 
+    @model_validator(mode="before")
+    @classmethod
+    def _detected_at_to_ns(cls, data: Any) -> Any:
+        """Accept ``detected_at`` as a datetime or ISO string and store it as nanoseconds."""
+        if isinstance(data, dict) and data.get("detected_at") is not None:
+            data = dict(data)
+            detected_at = data.pop("detected_at")
+            if isinstance(detected_at, str):
+                detected_at = datetime.fromisoformat(detected_at)
+            if detected_at.tzinfo is not None:
+                detected_at = detected_at.astimezone(timezone.utc).replace(tzinfo=None)
+            data.setdefault(
+                "detected_at_ns", (detected_at - _EPOCH) // timedelta(microseconds=1) * 1000
+            )
+        return data
+
+    @computed_field
+    @property
+    def detected_at(self) -> datetime:
+        """Detection time as a naive UTC datetime, derived from ``detected_at_ns``."""
+        return _EPOCH + timedelta(microseconds=self.detected_at_ns // 1000)
+
 
 class RiskScore(BaseModel):
     """Aggregated risk score from the orchestrator."""
@@ -0,0 +1,112 @@
+"""Tests for the Orchestrator Agent's incremental risk totals and finding indexes."""
+
+import itertools
+import random
+
+import pytest
+
+from src.agents.orchestrator import SEVERITY_WEIGHTS, OrchestratorAgent
+from src.models.compliance import ComplianceFinding, ComplianceFramework, Severity, SignalSource
+
+_SEVERITIES = list(Severity)
+_FRAMEWORKS = list(ComplianceFramework)
+_BASE_NS = 1_700_000_000_000_000_000
+
+
+def _finding(i: int, rng: random.Random, detected_at_ns: int) -> ComplianceFinding:
+    return ComplianceFinding(
+        id=f"f-{i}",
+        source=SignalSource.DOCUMENT,
+        title=f"Finding {i}",
+        description="",
+        severity=rng.choice(_SEVERITIES),
+        frameworks=rng.sample(_FRAMEWORKS, rng.randint(0, 3)),
+        confidence=rng.choice([0.5, 0.6, 0.7, 0.85, 1.0]),
+        detected_at_ns=detected_at_ns,
+    )
+
+
+def _ingest_random(orchestrator: OrchestratorAgent, rng: random.Random, ids, times) -> None:
+    batch = [_finding(i, rng, t) for i, t in zip(ids, times)]
+    for start in range(0, len(batch), 7):
+        orchestrator.ingest_findings(batch[start:start + 7])
+
+
+def _assert_risk_matches_scratch(orchestrator: OrchestratorAgent) -> None:
+    findings = orchestrator.findings
+    total = sum(SEVERITY_WEIGHTS[f.severity] * f.confidence for f in findings)
+    fw_weight: dict[ComplianceFramework, float] = {}
+    for f in findings:
+        for fw in f.frameworks:
+            fw_weight[fw] = fw_weight.get(fw, 0.0) + SEVERITY_WEIGHTS[f.severity] * f.confidence
+
+    risk = orchestrator.get_risk_score()
+    assert risk.overall_score == pytest.approx(round(min(100.0, total / 20.0 * 100.0), 1))
+    assert risk.framework_scores == pytest.approx(
+        {fw: min(100.0, w / 10.0 * 100.0) for fw, w in fw_weight.items()}
+    )
+    assert risk.findings_count == len(findings)
+    assert risk.critical_count == sum(f.severity is Severity.CRITICAL for f in findings)
+    assert risk.high_count == sum(f.severity is Severity.HIGH for f in findings)
+
+
+def _assert_queries_match_sorted(orchestrator: OrchestratorAgent) -> None:
+    for severity, framework in itertools.product([None, *_SEVERITIES], [None, *_FRAMEWORKS]):
+        matching = [
+            f
+            for f in orchestrator.findings
+            if (severity is None or f.severity is severity)
+            and (framework is None or framework in f.frameworks)
+        ]
+        expected = sorted(matching, key=lambda f: f.detected_at_ns, reverse=True)
+        for limit in (0, 1, 5, 50, 1000):
+            got = orchestrator.query_findings(severity, framework, limit)
+            assert [f.id for f in got] == [f.id for f in expected[:limit]], (
+                severity,
+                framework,
+                limit,
+            )
+
+
+def test_risk_matches_from_scratch_sum():
+    rng = random.Random(7)
+    orchestrator = OrchestratorAgent()
+    _assert_risk_matches_scratch(orchestrator)
+    _ingest_random(orchestrator, rng, range(200), (_BASE_NS + i for i in range(200)))
+    _assert_risk_matches_scratch(orchestrator)
+
+
+def test_query_findings_matches_sort_before_and_after_out_of_order_ingest():
+    rng = random.Random(11)
+    orchestrator = OrchestratorAgent()
+    _ingest_random(orchestrator, rng, range(150), (_BASE_NS + 10 * i for i in range(150)))
+    assert orchestrator._ingested_in_time_order
+    _assert_queries_match_sorted(orchestrator)
+
+    # Findings detected before ones already ingested, e.g. from a slow PR scan
+    late = list(range(150, 220))
+    times = [_BASE_NS + 10 * rng.randrange(150) + 5 for _ in late]
+    _ingest_random(orchestrator, rng, late, times)
+    assert not orchestrator._ingested_in_time_order
+    _assert_queries_match_sorted(orchestrator)
+    assert orchestrator.get_dashboard_summary()["recent_findings"] == [
+        f.model_dump() for f in orchestrator.query_findings(limit=10)
+    ]
+
+
+def test_duplicates_within_and_across_batches_are_counted_once():
+    rng = random.Random(3)
+    first = _finding(1, rng, _BASE_NS)
+    copy = first.model_copy()
+    second = _finding(2, rng, _BASE_NS + 1)
+    orchestrator = OrchestratorAgent()
+
+    orchestrator.ingest_findings([first, copy, second, first])
+    assert [f.id for f in orchestrator.findings] == ["f-1", "f-2"]
+    _assert_risk_matches_scratch(orchestrator)
+
+    orchestrator.ingest_findings([copy, second])
+    assert [f.id for f in orchestrator.findings] == ["f-1", "f-2"]
+    assert orchestrator._finding_by_id["f-1"] is first
+    _assert_risk_matches_scratch(orchestrator)
+    _assert_queries_match_sorted(orchestrator)
@@ -0,0 +1,86 @@
+"""Tests for the PR Monitor Agent's streaming diff scan."""
+
+import random
+
+import pytest
+
+from src.agents import pr_monitor
+from src.agents.pr_monitor import COMPLIANCE_PATTERNS, PRMonitorAgent, _DiffScanner
+
+_PATTERNS = [pattern for patterns in COMPLIANCE_PATTERNS.values() for pattern in patterns]
+_FILLER = ["+", "-", " ", "def", "return", "x = 1", "diff --git a/b", "@@ -1,3 +1,4 @@", "foo"]
+
+
+def _extract_context(diff: str, pattern: str, context_lines: int = 3) -> str:
+    """Whole-diff context extraction the streaming scan must reproduce."""
+    lines = diff.split("\n")
+    for i, line in enumerate(lines):
+        if pattern.lower() in line.lower():
+            start = max(0, i - context_lines)
+            end = min(len(lines), i + context_lines + 1)
+            return "\n".join(lines[start:end])
+    return ""
+
+
+def _expected(diff: str) -> dict:
+    return {
+        (framework, pattern): _extract_context(diff, pattern)
+        for framework, patterns in COMPLIANCE_PATTERNS.items()
+        for pattern in patterns
+        if pattern.lower() in diff.lower()
+    }
+
+
+def _random_diff(rng: random.Random) -> str:
+    tokens = []
+    for _ in range(rng.randint(0, 60)):
+        r = rng.random()
+        if r < 0.3:
+            tokens.append("\n" * rng.randint(1, 3))
+        elif r < 0.45:
+            pattern = rng.choice(_PATTERNS)
+            tokens.append(pattern.upper() if rng.random() < 0.3 else pattern)
+        elif r < 0.5:
+            tokens.append("z" * rng.randint(50, 500))  # a long, pattern-free run
+        else:
+            tokens.append(rng.choice(_FILLER))
+        tokens.append(rng.choice(["", " ", "_"]))
+    return "".join(tokens)
+
+
+def _random_chunks(rng: random.Random, text: str) -> list[str]:
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 12))))
+    bounds = [0, *cuts, len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+@pytest.fixture(params=["aho-corasick", "hyperscan"])
+def agent(request, monkeypatch):
+    if request.param == "aho-corasick":
+        monkeypatch.setattr(pr_monitor, "_PR_HS_DB", None)
+    elif pr_monitor._PR_HS_DB is None:
+        pytest.skip("hyperscan is not installed")
+    return PRMonitorAgent()
+
+
+def test_streamed_contexts_match_whole_diff_extraction(agent):
+    rng = random.Random(1234)
+    for _ in range(500):
+        diff = _random_diff(rng)
+        scanner = _DiffScanner(agent._scan_diff)
+        for chunk in _random_chunks(rng, diff):
+            scanner.feed(chunk)
+        hits = scanner.close()
+        got = {(framework, pattern): context for framework, pattern, context in hits}
+        assert len(got) == len(hits)
+        assert got == _expected(diff), repr(diff)
+
+
+def test_long_single_line_across_many_chunks(agent):
+    diff = "a\n" + "x" * 100_000 + "password" + "y" * 100_000 + "\nb\n"
+    scanner = _DiffScanner(agent._scan_diff)
+    for i in range(0, len(diff), 4096):
+        scanner.feed(diff[i:i + 4096])
+    hits = scanner.close()
+    assert [(framework, pattern) for framework, pattern, _ in hits] == list(_expected(diff))
+    assert hits[0][2] == _extract_context(diff, "password")
@@ -0,0 +1,90 @@
+"""Tests for the Slack Monitor Agent's batched keyword scan."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.agents import slack_monitor
+from src.agents.slack_monitor import POLICY_PATTERNS, SlackMonitorAgent
+
+_KEYWORDS = [keyword for c in POLICY_PATTERNS.values() for keyword in c["keywords"]]
+_FILLER = ["hey", "team", "ok", " ", "\n", "\x01", "İstanbul", "ß", "日本語", "café", "!"]
+
+
+def _random_text(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 12)):
+        if rng.random() < 0.3:
+            keyword = rng.choice(_KEYWORDS)
+            parts.append(keyword.upper() if rng.random() < 0.3 else keyword)
+        else:
+            parts.append(rng.choice(_FILLER))
+        parts.append(rng.choice(["", " ", "\x01"]))
+    return "".join(parts)
+
+
+def _random_messages(rng: random.Random, n: int) -> list[dict]:
+    return [
+        {"channel": rng.choice(["c1", "c2"]), "user": "u", "text": _random_text(rng), "ts": str(i)}
+        for i in range(n)
+    ]
+
+
+def _dump(findings) -> list[dict]:
+    return [f.model_dump() | {"detected_at": None} for f in findings]
+
+
+def _per_message(agent: SlackMonitorAgent, messages: list[dict]) -> list[dict]:
+    return _dump(
+        f
+        for m in messages
+        for f in agent.analyze_message(m["channel"], m["user"], m["text"], m["ts"])
+    )
+
+
+@pytest.fixture(params=["aho-corasick", "hyperscan"])
+def backend(request, monkeypatch):
+    if request.param == "aho-corasick":
+        monkeypatch.setattr(slack_monitor, "_HS_DB", None)
+    elif slack_monitor._HS_DB is None:
+        pytest.skip("hyperscan is not installed")
+
+
+def test_batch_matches_per_message_results(backend):
+    rng = random.Random(42)
+    for _ in range(200):
+        messages = _random_messages(rng, rng.randint(1, 8))
+        expected = _per_message(SlackMonitorAgent(), messages)
+        batch_agent = SlackMonitorAgent()
+        assert _dump(batch_agent.analyze_batch(messages)) == expected
+        # Again, now answered from the match cache
+        assert _dump(batch_agent.analyze_batch(messages)) == expected
+
+
+def test_separator_and_non_ascii_text(backend):
+    messages = [
+        {"channel": "c", "user": "u", "text": "skip auth\x01credit card", "ts": "1"},
+        {"channel": "c", "user": "u", "text": "İİİ patient name", "ts": "2"},
+        {"channel": "c", "user": "u", "text": "\x01", "ts": "3"},
+        {"channel": "c", "user": "u", "text": "DATA TRANSFER ß opt-out", "ts": "4"},
+    ]
+    findings = SlackMonitorAgent().analyze_batch(messages)
+    assert [(f.metadata["pattern"], f.metadata["keyword"]) for f in findings] == [
+        ("access_bypass", "skip auth"),
+        ("payment_data", "credit card"),
+        ("patient_info", "patient name"),
+        ("data_sharing", "data transfer"),
+        ("consent_discussion", "opt-out"),
+    ]
+    assert _dump(findings) == _per_message(SlackMonitorAgent(), messages)
+
+
+def test_concurrent_batches_on_worker_threads(backend):
+    rng = random.Random(5)
+    batches = [_random_messages(rng, 20) for _ in range(32)]
+    expected = [_per_message(SlackMonitorAgent(), batch) for batch in batches]
+    agent = SlackMonitorAgent()
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(agent.analyze_batch, batches))
+    assert [_dump(findings) for findings in results] == expected